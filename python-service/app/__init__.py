@@ -3,25 +3,53 @@
 from __future__ import annotations
 
 import asyncio
-import io
-import tempfile
-from pathlib import Path
-from typing import Optional
-
-import soundfile as sf
+import functools
+import struct
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Callable, Iterator, Optional, TypeVar
+
+import anyio.to_thread
+import numpy as np
 from fastapi import FastAPI, File, Form, HTTPException, UploadFile
-from fastapi.responses import JSONResponse, StreamingResponse
+from fastapi.responses import ORJSONResponse, StreamingResponse
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel
 
-from .config import ALLOWED_ORIGINS
-from .languages import DEFAULT_TARGET_LANGUAGE, LANGUAGE_CONFIG
-from .pipeline import pipelines
+from .config import ALLOWED_ORIGINS, PIPELINE_THREADS, PRELOAD_ALL_LANGUAGES
+from .languages import DEFAULT_TARGET_LANGUAGE, LANG_SPECS, LANGUAGE_CONFIG, LangSpec
+from .pipeline import TranslationPipeline, decode_audio_bytes, pipelines
+
+T = TypeVar("T")
+
+# Frames converted to PCM16 per streamed chunk (~1.4 s at 24 kHz).
+WAV_CHUNK_FRAMES = 32768
+
+
+async def _preload_pipelines() -> None:
+    loop = asyncio.get_running_loop()
+    languages = list(LANG_SPECS) if PRELOAD_ALL_LANGUAGES else [DEFAULT_TARGET_LANGUAGE]
+    with ThreadPoolExecutor(max_workers=len(languages), thread_name_prefix="preload") as pool:
+        await asyncio.gather(*(loop.run_in_executor(pool, pipelines.get, lang) for lang in languages))
+
+
+@asynccontextmanager
+async def lifespan(_: FastAPI) -> AsyncIterator[None]:
+    loop = asyncio.get_running_loop()
+    loop.set_default_executor(
+        ThreadPoolExecutor(max_workers=PIPELINE_THREADS, thread_name_prefix="pipeline")
+    )
+    anyio.to_thread.current_default_thread_limiter().total_tokens = PIPELINE_THREADS
+    await _preload_pipelines()
+    yield
+
 
 app = FastAPI(
     title="Global Language Translation Service",
     version="1.0.0",
     description="Speech-to-text, machine translation and optional TTS served via FastAPI.",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
 allow_all_origins = ALLOWED_ORIGINS == ["*"]
@@ -50,37 +78,97 @@ class TTSRequest(BaseModel):
     voice: Optional[str] = None
 
 
-async def _save_upload(upload: UploadFile) -> Path:
+async def _read_upload(upload: UploadFile) -> bytes:
     data = await upload.read()
     if not data:
         raise HTTPException(status_code=400, detail="Uploaded file is empty.")
-    suffix = Path(upload.filename or "audio").suffix or ".wav"
-    with tempfile.NamedTemporaryFile(delete=False, suffix=suffix) as tmp:
-        tmp.write(data)
-        return Path(tmp.name)
+    return data
 
 
-def _resolve_language(lang: Optional[str]) -> str:
-    return (lang or DEFAULT_TARGET_LANGUAGE).strip().lower()
+def _resolve_language(lang: Optional[str]) -> LangSpec:
+    if not lang:
+        return LANG_SPECS[DEFAULT_TARGET_LANGUAGE]
+    # Fast path for already-normalised names; only odd casing/whitespace pays for the copy.
+    spec = LANG_SPECS.get(lang)
+    if spec is None:
+        normalised = lang.strip().lower()
+        spec = LANG_SPECS.get(normalised)
+        if spec is None:
+            raise HTTPException(status_code=400, detail=f"Unsupported language: {normalised}")
+    return spec
 
 
 def _get_pipeline(lang: Optional[str]):
-    language = _resolve_language(lang)
+    spec = _resolve_language(lang)
     try:
-        return pipelines.get(language), language
+        return pipelines.get(spec.key), spec.key
     except ValueError as exc:
         raise HTTPException(status_code=400, detail=str(exc)) from exc
 
 
-@app.on_event("startup")
-async def preload_default_pipeline() -> None:
-    loop = asyncio.get_event_loop()
-    await loop.run_in_executor(None, pipelines.get, DEFAULT_TARGET_LANGUAGE)
+async def _run_blocking(func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """Run a blocking pipeline call on the worker pool without stalling the event loop."""
+    loop = asyncio.get_running_loop()
+    if kwargs:
+        func = functools.partial(func, **kwargs)
+    return await loop.run_in_executor(None, func, *args)
+
+
+async def _translate(pipeline: TranslationPipeline, text: str) -> str:
+    """Tokenise on the worker pool, then await the batched translation on the event loop.
+
+    Waiting for the batcher does not occupy a pool thread, so a batch can fill up to
+    CT2_MAX_BATCH_SIZE requests and pending translations do not starve /transcribe or /tts.
+    """
+    future = await _run_blocking(pipeline.submit_translation, text)
+    return await asyncio.wrap_future(future)
+
+
+def _wav_header(num_frames: int, sample_rate: int) -> bytes:
+    """Build a 44-byte RIFF header for mono 16-bit PCM."""
+    data_size = num_frames * 2
+    return struct.pack(
+        "<4sI4s4sIHHIIHH4sI",
+        b"RIFF",
+        36 + data_size,
+        b"WAVE",
+        b"fmt ",
+        16,
+        1,
+        1,
+        sample_rate,
+        sample_rate * 2,
+        2,
+        16,
+        b"data",
+        data_size,
+    )
+
+
+def _wav_stream(audio: np.ndarray, sample_rate: int) -> Iterator[bytes]:
+    """Yield a WAV file chunk by chunk so only one PCM16 slice is materialised at a time.
+
+    ``audio`` must already be peak-normalised to [-1, 1] (``TranslationPipeline.tts``
+    guarantees this), so samples are scaled straight into a reused int16 buffer without
+    clipping or a float temporary.
+    """
+    yield _wav_header(audio.shape[0], sample_rate)
+    pcm = np.empty(min(WAV_CHUNK_FRAMES, audio.shape[0]), dtype="<i2")
+    for start in range(0, audio.shape[0], WAV_CHUNK_FRAMES):
+        chunk = audio[start : start + WAV_CHUNK_FRAMES]
+        out = pcm[: chunk.shape[0]]
+        np.multiply(chunk, 32767, out=out, casting="unsafe")
+        yield out.tobytes()
+
+
+def _wav_response(audio: np.ndarray, sample_rate: int, lang: str) -> StreamingResponse:
+    headers = {"X-Target-Language": lang}
+    return StreamingResponse(_wav_stream(audio, sample_rate), media_type="audio/wav", headers=headers)
 
 
 @app.get("/health")
-def health() -> JSONResponse:
-    return JSONResponse(
+def health() -> ORJSONResponse:
+    return ORJSONResponse(
         {
             "status": "ok",
             "available_languages": list(LANGUAGE_CONFIG.keys()),
@@ -90,8 +178,8 @@ def health() -> JSONResponse:
 
 
 @app.get("/languages")
-def languages() -> JSONResponse:
-    return JSONResponse({"languages": LANGUAGE_CONFIG})
+def languages() -> ORJSONResponse:
+    return ORJSONResponse({"languages": LANGUAGE_CONFIG})
 
 
 @app.post("/transcribe")
@@ -99,15 +187,13 @@ async def transcribe(
     file: UploadFile = File(...),
     language_hint: Optional[str] = Form(default=None),
     target_language: Optional[str] = Form(default=DEFAULT_TARGET_LANGUAGE),
-) -> JSONResponse:
+) -> ORJSONResponse:
     pipeline, lang = _get_pipeline(target_language)
-    tmp_path = await _save_upload(file)
-    try:
-        transcript = pipeline.transcribe(tmp_path, language_hint=language_hint)
-    finally:
-        tmp_path.unlink(missing_ok=True)
-    translation = pipeline.translate(transcript)
-    return JSONResponse(
+    data = await _read_upload(file)
+    audio = await _run_blocking(decode_audio_bytes, data)
+    transcript = await _run_blocking(pipeline.transcribe_array, audio, language_hint=language_hint)
+    translation = await _translate(pipeline, transcript)
+    return ORJSONResponse(
         {
             "transcript": transcript,
             "translated": translation,
@@ -117,26 +203,22 @@ async def transcribe(
 
 
 @app.post("/translate", response_model=TranslateResponse)
-def translate(request: TranslateRequest) -> TranslateResponse:
+async def translate(request: TranslateRequest) -> TranslateResponse:
     pipeline, lang = _get_pipeline(request.target_language)
-    translation = pipeline.translate(request.text)
+    translation = await _translate(pipeline, request.text)
     return TranslateResponse(translated=translation, target_language=lang)
 
 
 @app.post("/tts")
-def tts(request: TTSRequest) -> StreamingResponse:
+async def tts(request: TTSRequest) -> StreamingResponse:
     pipeline, lang = _get_pipeline(request.target_language)
     try:
-        audio, sample_rate = pipeline.tts(request.text, request.voice)
+        audio, sample_rate = await _run_blocking(pipeline.tts, request.text, request.voice)
     except RuntimeError as exc:
         raise HTTPException(status_code=501, detail=str(exc)) from exc
     if audio.size == 0:
         raise HTTPException(status_code=500, detail="No audio generated.")
-    buffer = io.BytesIO()
-    sf.write(buffer, audio, sample_rate, format="WAV")
-    buffer.seek(0)
-    headers = {"X-Target-Language": lang}
-    return StreamingResponse(buffer, media_type="audio/wav", headers=headers)
+    return _wav_response(audio, sample_rate, lang)
 
 
 @app.post("/tts/clone")
@@ -148,16 +230,12 @@ async def tts_clone(
     pipeline, lang = _get_pipeline(target_language)
     sample_bytes = await speaker.read() if speaker else None
     try:
-        audio, sample_rate = pipeline.tts(text, speaker_sample=sample_bytes)
+        audio, sample_rate = await _run_blocking(pipeline.tts, text, speaker_sample=sample_bytes)
     except RuntimeError as exc:
         raise HTTPException(status_code=501, detail=str(exc)) from exc
     if audio.size == 0:
         raise HTTPException(status_code=500, detail="No audio generated.")
-    buffer = io.BytesIO()
-    sf.write(buffer, audio, sample_rate, format="WAV")
-    buffer.seek(0)
-    headers = {"X-Target-Language": lang}
-    return StreamingResponse(buffer, media_type="audio/wav", headers=headers)
+    return _wav_response(audio, sample_rate, lang)
 
 
 __all__ = ["app"]
@@ -5,6 +5,10 @@ from pathlib import Path
 BASE_DIR = Path(__file__).resolve().parents[1]
 
 WHISPER_MODEL = os.getenv("WHISPER_MODEL", "small")
+WHISPER_BATCH_SIZE = int(os.getenv("WHISPER_BATCH_SIZE", "16"))
+# Optional compute type overrides; left unset, they are picked per device at load time.
+WHISPER_COMPUTE_TYPE = os.getenv("WHISPER_COMPUTE_TYPE") or None
+CT2_COMPUTE_TYPE = os.getenv("CT2_COMPUTE_TYPE") or None
 TRANSLATION_MODEL_ID = os.getenv("TRANSLATION_MODEL_ID", "facebook/nllb-200-distilled-600M")
 TRANSLATION_MODEL_DIR = Path(
     os.getenv(
@@ -24,12 +28,41 @@ def _parse_bool(raw: str) -> bool:
 ALLOWED_ORIGINS = _parse_origins(os.getenv("ALLOWED_ORIGINS", "*"))
 XTTS_MODEL_NAME = os.getenv("XTTS_MODEL_NAME", "tts_models/multilingual/multi-dataset/xtts_v2")
 XTTS_USE_GPU = _parse_bool(os.getenv("XTTS_USE_GPU", "false"))
+# Concurrent XTTS syntheses allowed on GPU hosts; CPU synthesis is always serialised.
+XTTS_MAX_CONCURRENCY = max(1, int(os.getenv("XTTS_MAX_CONCURRENCY", "1")))
 XTTS_DEFAULT_SPEAKER_DIR = (
     Path(os.getenv("XTTS_DEFAULT_SPEAKER_DIR")).expanduser().resolve()
     if os.getenv("XTTS_DEFAULT_SPEAKER_DIR")
     else None
 )
 
+# Worker threads used to run blocking model calls (Whisper, CTranslate2, TTS) off the
+# event loop so concurrent requests are not serialised behind a single inference.
+PIPELINE_THREADS = int(os.getenv("PIPELINE_THREADS", str(max(4, os.cpu_count() or 1))))
+
+# Load every configured language at startup instead of only the default one. Disable on
+# low-RAM hosts to load non-default languages lazily on their first request.
+PRELOAD_ALL_LANGUAGES = _parse_bool(os.getenv("PRELOAD_ALL_LANGUAGES", "true"))
+
+# Concurrent translate requests are coalesced into one CTranslate2 batch. A batch is
+# flushed once it holds CT2_MAX_BATCH_SIZE inputs or CT2_BATCH_WAIT_MS has elapsed.
+CT2_MAX_BATCH_SIZE = int(os.getenv("CT2_MAX_BATCH_SIZE", "32"))
+CT2_BATCH_WAIT_MS = float(os.getenv("CT2_BATCH_WAIT_MS", "10"))
+
+# Per-language LRU cache of recent translations. Inputs longer than
+# TRANSLATION_CACHE_MAX_CHARS are never cached; set TRANSLATION_CACHE_SIZE=0 to disable.
+TRANSLATION_CACHE_SIZE = int(os.getenv("TRANSLATION_CACHE_SIZE", "4096"))
+TRANSLATION_CACHE_MAX_CHARS = int(os.getenv("TRANSLATION_CACHE_MAX_CHARS", "512"))
+
+# CTranslate2/Whisper threading: CT2_INTER_THREADS batches (or transcriptions) run in
+# parallel, each using CT2_INTRA_THREADS compute threads. The defaults split the cores
+# between the two so the product does not oversubscribe the CPU.
+_CPU_COUNT = os.cpu_count() or 4
+CT2_INTER_THREADS = max(1, int(os.getenv("CT2_INTER_THREADS", str(min(4, _CPU_COUNT)))))
+CT2_INTRA_THREADS = max(
+    1, int(os.getenv("CT2_INTRA_THREADS", str(max(1, _CPU_COUNT // CT2_INTER_THREADS))))
+)
+
 # Audio chunk settings (in seconds) used by the previous CLI tools. Retained for reference
 # if you choose to implement streaming/microphone capture later.
 DEFAULT_CHUNK_LENGTH = 2.0
@@ -3,6 +3,11 @@
 Each entry links the NLLB translation token with Kokoro voice information.
 Extend the mapping to support additional locales.
 """
+from __future__ import annotations
+
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Mapping, Optional
 
 LANGUAGE_CONFIG = {
     "spanish": {
@@ -12,6 +17,7 @@ LANGUAGE_CONFIG = {
         "kokoro_lang": "es",
         "kokoro_voice": "af_heart",
         "pyttsx3_voice_hint": "spanish",
+        "espeak_voice": "es",
         "xtts_language": "es",
     },
     "english": {
@@ -21,6 +27,7 @@ LANGUAGE_CONFIG = {
         "kokoro_lang": "en",
         "kokoro_voice": "af_heart",
         "pyttsx3_voice_hint": "english",
+        "espeak_voice": "en",
         "xtts_language": "en",
     },
 }
@@ -28,4 +35,33 @@ LANGUAGE_CONFIG = {
 DEFAULT_TARGET_LANGUAGE = "spanish"
 DEFAULT_SOURCE_LANG = LANGUAGE_CONFIG[DEFAULT_TARGET_LANGUAGE]["source_lang_code"]
 
-__all__ = ["LANGUAGE_CONFIG", "DEFAULT_TARGET_LANGUAGE", "DEFAULT_SOURCE_LANG"]
+
+@dataclass(frozen=True, slots=True)
+class LangSpec:
+    """Resolved, immutable view of a ``LANGUAGE_CONFIG`` entry."""
+
+    key: str
+    translation_token: str
+    display_name: str
+    source_lang_code: str = DEFAULT_SOURCE_LANG
+    kokoro_lang: str = "en"
+    kokoro_voice: str = "af_heart"
+    pyttsx3_voice_hint: Optional[str] = None
+    pyttsx3_rate: int = 190
+    espeak_voice: Optional[str] = None
+    xtts_language: Optional[str] = None
+    xtts_reference: Optional[str] = None
+
+
+# Keyed by the normalised (lower-case) language name; built once at import time.
+LANG_SPECS: Mapping[str, LangSpec] = MappingProxyType(
+    {key.lower(): LangSpec(key=key.lower(), **values) for key, values in LANGUAGE_CONFIG.items()}
+)
+
+__all__ = [
+    "LANGUAGE_CONFIG",
+    "LANG_SPECS",
+    "LangSpec",
+    "DEFAULT_TARGET_LANGUAGE",
+    "DEFAULT_SOURCE_LANG",
+]
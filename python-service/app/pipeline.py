@@ -1,12 +1,22 @@
 """Core translation pipeline used by the web API."""
 from __future__ import annotations
 
+import io
 import os
+import queue
+import shutil
+import subprocess
+import sys
 import tempfile
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, Optional, Tuple, List
+from typing import Dict, Optional, Tuple, List, Union
 
 import logging
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, Optional, Tuple, List
 
@@ -14,24 +24,44 @@ import ctranslate2
 import numpy as np
 import pyttsx3
 import soundfile as sf
-from faster_whisper import WhisperModel
+from faster_whisper import WhisperModel, decode_audio
 from transformers import AutoTokenizer
 
 from .config import (
+    CT2_BATCH_WAIT_MS,
+    CT2_COMPUTE_TYPE,
+    CT2_INTER_THREADS,
+    CT2_INTRA_THREADS,
+    CT2_MAX_BATCH_SIZE,
+    TRANSLATION_CACHE_MAX_CHARS,
+    TRANSLATION_CACHE_SIZE,
     TRANSLATION_MODEL_DIR,
     TRANSLATION_MODEL_ID,
+    WHISPER_BATCH_SIZE,
+    WHISPER_COMPUTE_TYPE,
     WHISPER_MODEL,
     XTTS_DEFAULT_SPEAKER_DIR,
 )
-from .languages import DEFAULT_SOURCE_LANG, LANGUAGE_CONFIG
+from .languages import LANG_SPECS
 from .xtts_adapter import get_xtts_adapter
 
+try:
+    from faster_whisper import BatchedInferencePipeline
+except ImportError:  # pragma: no cover - requires faster-whisper >= 1.1
+    BatchedInferencePipeline = None  # type: ignore[assignment]
+
 try:
     from kokoro import KPipeline
 except ImportError:  # pragma: no cover - optional dependency
     KPipeline = None  # type: ignore[assignment]
 
 
+# On Linux, espeak-ng can write WAV to stdout, avoiding pyttsx3's temp-file round-trip.
+ESPEAK_NG = shutil.which("espeak-ng") if sys.platform.startswith("linux") else None
+# macOS' NSSpeechSynthesizer driver can only write AIFF.
+PYTTSX3_SUFFIX = ".aiff" if sys.platform == "darwin" else ".wav"
+
+
 def _ensure_translation_model() -> Path:
     """Ensure a converted CTranslate2 checkpoint is available locally."""
     target_dir = Path(TRANSLATION_MODEL_DIR)
@@ -41,10 +71,27 @@ def _ensure_translation_model() -> Path:
     raise RuntimeError(
         f"CTranslate2 model not found in {target_dir}. "
         "Run `python download_models.py --translation-model "
-        f"{TRANSLATION_MODEL_ID} --output-dir {target_dir}` before starting the service."
+        f"{TRANSLATION_MODEL_ID} --output-dir {target_dir} --quantization int8` "
+        "before starting the service."
     )
 
 
+def _load_tokenizer(model_dir: Path):
+    """Load the tokenizer from the converted model directory.
+
+    download_models.py copies the tokenizer files next to model.bin, so startup does not
+    depend on the Hugging Face cache. Older conversions fall back to the model ID.
+    """
+    if (model_dir / "tokenizer_config.json").exists():
+        try:
+            return AutoTokenizer.from_pretrained(str(model_dir), use_fast=False)
+        except (OSError, ValueError):
+            logging.getLogger(__name__).warning(
+                "Could not load the tokenizer from %s; falling back to %s", model_dir, TRANSLATION_MODEL_ID
+            )
+    return AutoTokenizer.from_pretrained(TRANSLATION_MODEL_ID, use_fast=False)
+
+
 def _device_for_translation() -> str:
     try:
         if ctranslate2.get_cuda_device_count() > 0:
@@ -54,24 +101,203 @@ def _device_for_translation() -> str:
     return "cpu"
 
 
+def decode_audio_bytes(data: bytes, sampling_rate: int = 16000) -> np.ndarray:
+    """Decode an encoded audio blob to mono float32 PCM without touching disk."""
+    return decode_audio(io.BytesIO(data), sampling_rate=sampling_rate)
+
+
+def _compute_types(device: str) -> Tuple[str, str]:
+    """Return the (whisper, translator) compute types for ``device``.
+
+    GPUs use float16 activations so matmuls run on tensor cores. CPUs use int8 weights,
+    with bfloat16 activations for the translator where the CPU supports them (AVX512-BF16).
+    """
+    if device == "cuda":
+        whisper_ct, ct2_ct = "float16", "int8_float16"
+    else:
+        whisper_ct, ct2_ct = "int8", "int8"
+        try:
+            if "int8_bfloat16" in ctranslate2.get_supported_compute_types("cpu"):
+                ct2_ct = "int8_bfloat16"
+        except Exception:
+            pass
+    return WHISPER_COMPUTE_TYPE or whisper_ct, CT2_COMPUTE_TYPE or ct2_ct
+
+
+def _finalise(audio: np.ndarray, channel_axis: int = 0) -> Tuple[np.ndarray, float]:
+    """Downmix to mono float32 and peak-normalise, touching the buffer as few times as possible.
+
+    Returns the finalised audio and its peak before normalisation. Mono float32 input is
+    normalised in place.
+    """
+    if audio.ndim > 1:
+        audio = audio.mean(axis=channel_axis, dtype=np.float32)
+    elif audio.dtype != np.float32 or not audio.flags.writeable:
+        audio = audio.astype(np.float32)
+    if not audio.size:
+        return audio, 0.0
+    peak = float(np.abs(audio).max())
+    if peak > 1e-4:
+        np.multiply(audio, 1.0 / peak, out=audio)
+    return audio, peak
+
+
+class TranslationBatcher:
+    """Coalesces concurrent translate calls into a single ``translate_batch`` request.
+
+    :meth:`submit` returns a future straight away, so waiting callers do not hold a
+    thread. A background thread drains the queue into batches and hands them to
+    ``workers`` decode threads, letting CTranslate2 decode up to ``inter_threads`` batches
+    in parallel; while all of them are busy, new requests keep accumulating into the next
+    batch.
+    """
+
+    def __init__(
+        self,
+        translator: ctranslate2.Translator,
+        max_batch_size: int = CT2_MAX_BATCH_SIZE,
+        max_wait: float = CT2_BATCH_WAIT_MS / 1000.0,
+        workers: int = CT2_INTER_THREADS,
+    ) -> None:
+        self.translator = translator
+        self.max_batch_size = max(1, max_batch_size)
+        self.max_wait = max(0.0, max_wait)
+        self._queue: "queue.Queue[Tuple[List[str], List[str], Future]]" = queue.Queue()
+        self._slots = threading.BoundedSemaphore(max(1, workers))
+        self._workers = ThreadPoolExecutor(max_workers=max(1, workers), thread_name_prefix="ct2-decode")
+        self._thread = threading.Thread(target=self._run, name="ct2-batcher", daemon=True)
+        self._thread.start()
+
+    def submit(self, tokens: List[str], target_prefix: List[str]) -> Future:
+        """Queue one source sentence; the future resolves to the best hypothesis' tokens."""
+        future: Future = Future()
+        self._queue.put((tokens, target_prefix, future))
+        return future
+
+    def _collect(self) -> List[Tuple[List[str], List[str], Future]]:
+        batch = [self._queue.get()]
+        deadline = time.monotonic() + self.max_wait
+        while len(batch) < self.max_batch_size:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(self._queue.get(timeout=remaining))
+            except queue.Empty:
+                break
+        return batch
+
+    def _run(self) -> None:
+        while True:
+            self._slots.acquire()
+            batch = self._collect()
+            self._workers.submit(self._translate, batch)
+
+    def _translate(self, batch: List[Tuple[List[str], List[str], Future]]) -> None:
+        try:
+            results = self.translator.translate_batch(
+                [tokens for tokens, _, _ in batch],
+                beam_size=1,
+                num_hypotheses=1,
+                target_prefix=[prefix for _, prefix, _ in batch],
+                prefix_bias_beta=0.5,
+                max_batch_size=self.max_batch_size,
+            )
+        except Exception as exc:
+            for _, _, future in batch:
+                future.set_exception(exc)
+        else:
+            for (_, _, future), result in zip(batch, results):
+                future.set_result(result.hypotheses[0])
+        finally:
+            self._slots.release()
+
+
+class SharedModels:
+    """Language-agnostic models shared by every :class:`TranslationPipeline`.
+
+    NLLB's tokenizer and translator are multilingual and Whisper does not depend on the
+    target language, so a single instance of each serves all configured languages.
+    """
+
+    def __init__(self) -> None:
+        self.logger = logging.getLogger(__name__)
+        self.model_dir = _ensure_translation_model()
+        self.device = _device_for_translation()
+        self.tokenizer = _load_tokenizer(self.model_dir)
+        # ``src_lang`` is tokenizer state, so encoding is serialised across languages.
+        self.tokenizer_lock = threading.Lock()
+
+        whisper_compute_type, ct2_compute_type = _compute_types(self.device)
+        self.translator = ctranslate2.Translator(
+            str(self.model_dir),
+            device=self.device,
+            compute_type=ct2_compute_type,
+            inter_threads=CT2_INTER_THREADS,
+            intra_threads=CT2_INTRA_THREADS,
+        )
+        self.batcher = TranslationBatcher(self.translator)
+        self.whisper = WhisperModel(
+            WHISPER_MODEL,
+            device=self.device,
+            compute_type=whisper_compute_type,
+            cpu_threads=CT2_INTRA_THREADS,
+            num_workers=CT2_INTER_THREADS,
+        )
+        self.whisper_batched: Optional[BatchedInferencePipeline] = None
+        if BatchedInferencePipeline is not None:
+            try:
+                self.whisper_batched = BatchedInferencePipeline(model=self.whisper)
+            except Exception:
+                self.logger.exception("Batched Whisper unavailable; using sequential decoding")
+
+
+_shared_models: Optional[SharedModels] = None
+_shared_models_lock = threading.Lock()
+
+
+# pyttsx3.init() hands every caller the same per-driver engine, so all pipelines share
+# it; the lock serialises runAndWait() and each pipeline's rate/voice settings.
+_pyttsx3_engine = None
+_pyttsx3_lock = threading.Lock()
+
+
+def get_shared_models() -> SharedModels:
+    """Return the process-wide :class:`SharedModels`, loading them on first use."""
+    global _shared_models
+    if _shared_models is not None:
+        return _shared_models
+    with _shared_models_lock:
+        if _shared_models is None:
+            _shared_models = SharedModels()
+        return _shared_models
+
+
 class TranslationPipeline:
-    """Wraps Whisper, NLLB (via CTranslate2) and Kokoro for reuse."""
+    """Per-language view over the shared Whisper/NLLB models, plus Kokoro for TTS."""
 
     def __init__(self, target_language: str) -> None:
-        if target_language not in LANGUAGE_CONFIG:
+        spec = LANG_SPECS.get(target_language)
+        if spec is None:
             raise ValueError(f"Unsupported language: {target_language}")
 
-        self.lang_key = target_language
+        self.lang_key = spec.key
+        self.spec = spec
         self.logger = logging.getLogger(__name__)
-        self.lang_config = LANGUAGE_CONFIG[target_language]
-        self.model_dir = _ensure_translation_model()
-        self.tokenizer = AutoTokenizer.from_pretrained(TRANSLATION_MODEL_ID, use_fast=False)
-        self.source_lang = self.lang_config.get("source_lang_code", DEFAULT_SOURCE_LANG)
-        self.target_token = self._resolve_target_token(self.lang_config["translation_token"], self.tokenizer)
-        self.device = _device_for_translation()
-        self.xtts_language = self.lang_config.get("xtts_language")
+        shared = get_shared_models()
+        self.model_dir = shared.model_dir
+        self.device = shared.device
+        self.tokenizer = shared.tokenizer
+        self._tokenizer_lock = shared.tokenizer_lock
+        self.translator = shared.translator
+        self.batcher = shared.batcher
+        self.whisper = shared.whisper
+        self.whisper_batched = shared.whisper_batched
+        self.source_lang = spec.source_lang_code
+        self.target_token = self._resolve_target_token(spec.translation_token, self.tokenizer)
+        self.xtts_language = spec.xtts_language
         self.xtts_reference: Optional[Path] = None
-        configured_reference = self.lang_config.get("xtts_reference")
+        configured_reference = spec.xtts_reference
         if configured_reference:
             candidate = Path(configured_reference).expanduser().resolve()
             if candidate.exists():
@@ -81,29 +307,25 @@ class TranslationPipeline:
             if candidate.exists():
                 self.xtts_reference = candidate
 
-        self.tokenizer.src_lang = self.source_lang
-        if hasattr(self.tokenizer, "tgt_lang"):
-            self.tokenizer.tgt_lang = self.target_token
+        self._target_prefix = [self.target_token]
+        self._skip_tokens = frozenset(("<pad>", "</s>", "<unk>", self.target_token))
+        self._cache: "OrderedDict[str, str]" = OrderedDict()
+        self._cache_max = TRANSLATION_CACHE_SIZE
+        self._cache_lock = threading.Lock()
+        self._tokenize = lru_cache(maxsize=1024)(self._encode)
 
-        self.translator = ctranslate2.Translator(
-            str(self.model_dir),
-            device=self.device,
-            compute_type="int8",
-        )
-        self.whisper = WhisperModel(
-            WHISPER_MODEL,
-            device=self.device,
-            compute_type="int8",
-        )
         self.kokoro: Optional[KPipeline] = None
-        self.kokoro_voice = self.lang_config.get("kokoro_voice", "af_heart")
+        self.kokoro_voice = spec.kokoro_voice
         self.kokoro_sample_rate = 24000
-        self.pyttsx3_voice_hint = self.lang_config.get("pyttsx3_voice_hint")
-        self.pyttsx3_rate = self.lang_config.get("pyttsx3_rate", 190)
+        self.pyttsx3_voice_hint = spec.pyttsx3_voice_hint
+        self.pyttsx3_rate = spec.pyttsx3_rate
+        self.espeak_voice = spec.espeak_voice
+        self._pyttsx3_voice_id: Optional[str] = None
+        self._pyttsx3_voice_resolved = False
         self.logger = logging.getLogger(__name__)
         if KPipeline is not None:
             try:
-                self.kokoro = KPipeline(lang_code=self.lang_config.get("kokoro_lang", "en"))
+                self.kokoro = KPipeline(lang_code=spec.kokoro_lang)
             except Exception:
                 self.kokoro = None
 
@@ -117,32 +339,81 @@ class TranslationPipeline:
         return token_code
 
     def transcribe(self, audio_file: Path, language_hint: Optional[str] = None) -> str:
-        segments, _ = self.whisper.transcribe(
-            str(audio_file),
-            beam_size=1,
-            language=language_hint,
-        )
+        return self._transcribe(str(audio_file), language_hint)
+
+    def transcribe_array(self, audio: np.ndarray, language_hint: Optional[str] = None) -> str:
+        """Transcribe 16 kHz mono float32 samples, e.g. from :func:`decode_audio_bytes`."""
+        return self._transcribe(audio, language_hint)
+
+    def _transcribe(self, audio: Union[str, np.ndarray], language_hint: Optional[str]) -> str:
+        if self.whisper_batched is not None:
+            segments, _ = self.whisper_batched.transcribe(
+                audio,
+                batch_size=WHISPER_BATCH_SIZE,
+                beam_size=1,
+                language=language_hint,
+                vad_filter=True,
+            )
+        else:
+            segments, _ = self.whisper.transcribe(
+                audio,
+                beam_size=1,
+                language=language_hint,
+            )
         return " ".join(seg.text.strip() for seg in segments if seg.text.strip())
 
+    def _encode(self, text: str) -> List[str]:
+        # Cached by ``self._tokenize``; callers must not mutate the returned list.
+        with self._tokenizer_lock:
+            self.tokenizer.src_lang = self.source_lang
+            input_ids = self.tokenizer.encode(text)
+        return self.tokenizer.convert_ids_to_tokens(input_ids)
+
     def translate(self, text: str) -> str:
+        return self.submit_translation(text).result()
+
+    def submit_translation(self, text: str) -> Future:
+        """Tokenise ``text`` and queue it for translation without waiting for the result.
+
+        The returned future resolves to the translated string; empty input and cache hits
+        come back already resolved. Detokenisation runs on the batcher's decode thread.
+        """
+        future: Future = Future()
+        # Not cancellable: the batcher may already be decoding it.
+        future.set_running_or_notify_cancel()
         if not text:
-            return ""
-        encoded = self.tokenizer(text, return_tensors="np")
-        input_ids = encoded["input_ids"][0].tolist()
-        tokens = self.tokenizer.convert_ids_to_tokens(input_ids)
-        result = self.translator.translate_batch(
-            [tokens],
-            beam_size=1,
-            num_hypotheses=1,
-            target_prefix=[[self.target_token]],
-            prefix_bias_beta=0.5,
-        )[0]
-        filtered = [
-            tok
-            for tok in result.hypotheses[0]
-            if tok not in {"<pad>", "</s>", "<unk>", self.target_token}
-        ]
-        return self.tokenizer.convert_tokens_to_string(filtered).strip()
+            future.set_result("")
+            return future
+        cacheable = self._cache_max > 0 and len(text) <= TRANSLATION_CACHE_MAX_CHARS
+        if cacheable:
+            with self._cache_lock:
+                cached = self._cache.get(text)
+                if cached is not None:
+                    self._cache.move_to_end(text)
+                    future.set_result(cached)
+                    return future
+        # Long inputs skip the tokenisation cache too, so it does not fill up with paragraphs.
+        tokens = self._tokenize(text) if len(text) <= TRANSLATION_CACHE_MAX_CHARS else self._encode(text)
+
+        def _finish(batch_future: Future) -> None:
+            try:
+                hypothesis = batch_future.result()
+                skip = self._skip_tokens
+                translation = self.tokenizer.convert_tokens_to_string(
+                    [tok for tok in hypothesis if tok not in skip]
+                ).strip()
+            except Exception as exc:
+                future.set_exception(exc)
+                return
+            if cacheable:
+                with self._cache_lock:
+                    self._cache[text] = translation
+                    if len(self._cache) > self._cache_max:
+                        self._cache.popitem(last=False)
+            future.set_result(translation)
+
+        self.batcher.submit(tokens, self._target_prefix).add_done_callback(_finish)
+        return future
 
     def tts(
         self,
@@ -162,7 +433,7 @@ class TranslationPipeline:
                     default_sample=self.xtts_reference,
                 )
                 if audio.size:
-                    return self._normalise(audio), rate
+                    return _finalise(audio)[0], rate
             except Exception:
                 self.logger.exception("XTTS synthesis failed")
                 if speaker_sample:
@@ -173,82 +444,111 @@ class TranslationPipeline:
                 generator = self.kokoro(text, voice=voice or self.kokoro_voice)
                 chunks: list[np.ndarray] = []
                 for _, _, audio in generator:
-                    chunk = np.asarray(audio, dtype=np.float32)
+                    chunk = np.asarray(audio)
                     if chunk.ndim > 1:
-                        chunk = chunk.mean(axis=0)
+                        chunk = chunk.mean(axis=0, dtype=np.float32)
                     if chunk.size:
                         chunks.append(chunk)
                 if chunks:
-                    waveform = np.concatenate(chunks)
-                    if waveform.ndim > 1:
-                        waveform = waveform.mean(axis=0)
+                    # concatenate allocates a fresh float32 buffer that _finalise scales in place.
+                    waveform, energy = _finalise(np.concatenate(chunks).astype(np.float32, copy=False))
                     duration = waveform.size / float(self.kokoro_sample_rate)
-                    energy = float(np.max(np.abs(waveform))) if waveform.size else 0.0
                     if duration >= 0.8 and energy > 1e-4:
-                        return self._normalise(waveform), self.kokoro_sample_rate
+                        return waveform, self.kokoro_sample_rate
             except Exception:
                 # fall back to pyttsx3
                 pass
 
-        fallback = self._tts_with_pyttsx3(text)
+        fallback = self._tts_with_espeak(text) if ESPEAK_NG else None
+        if fallback is None:
+            fallback = self._tts_with_pyttsx3(text)
         if fallback is not None:
             return fallback
         raise RuntimeError(
             "Kokoro TTS is not installed or failed, and pyttsx3 fallback was unavailable."
         )
 
-    def _tts_with_pyttsx3(self, text: str) -> Optional[Tuple[np.ndarray, int]]:
+    def _tts_with_espeak(self, text: str) -> Optional[Tuple[np.ndarray, int]]:
+        cmd = [ESPEAK_NG, "--stdout", "--stdin", "-s", str(self.pyttsx3_rate)]
+        if self.espeak_voice:
+            cmd += ["-v", self.espeak_voice]
         try:
-            engine = pyttsx3.init()
-            engine.setProperty("rate", self.pyttsx3_rate)
+            proc = subprocess.run(cmd, input=text.encode("utf-8"), capture_output=True, check=True)
+            data, sample_rate = sf.read(io.BytesIO(proc.stdout), dtype="float32", always_2d=False)
+            if data.size == 0:
+                return None
+            return _finalise(data, channel_axis=1)[0], sample_rate
+        except Exception:
+            self.logger.exception("espeak-ng synthesis failed")
+            return None
+
+    def _get_pyttsx3_engine(self):
+        """Return the shared engine set up for this language; callers must hold ``_pyttsx3_lock``."""
+        global _pyttsx3_engine
+        if _pyttsx3_engine is None:
+            _pyttsx3_engine = pyttsx3.init()
+        engine = _pyttsx3_engine
+        if not self._pyttsx3_voice_resolved:
             if self.pyttsx3_voice_hint:
                 voice_hint = self.pyttsx3_voice_hint.lower()
                 for voice in engine.getProperty("voices"):
                     if voice_hint in voice.name.lower():
-                        engine.setProperty("voice", voice.id)
+                        self._pyttsx3_voice_id = voice.id
                         break
+            self._pyttsx3_voice_resolved = True
+        # Another language may have changed these since this pipeline last spoke.
+        engine.setProperty("rate", self.pyttsx3_rate)
+        if self._pyttsx3_voice_id is not None:
+            engine.setProperty("voice", self._pyttsx3_voice_id)
+        return engine
 
-            with tempfile.NamedTemporaryFile(suffix=".aiff", delete=False) as tmp:
+    def _tts_with_pyttsx3(self, text: str) -> Optional[Tuple[np.ndarray, int]]:
+        try:
+            with tempfile.NamedTemporaryFile(suffix=PYTTSX3_SUFFIX, delete=False) as tmp:
                 tmp_path = tmp.name
             try:
-                engine.save_to_file(text, tmp_path)
-                engine.runAndWait()
-                engine.stop()
+                # pyttsx3 engines are not thread-safe, so the shared engine is used under a lock.
+                with _pyttsx3_lock:
+                    engine = self._get_pyttsx3_engine()
+                    engine.save_to_file(text, tmp_path)
+                    engine.runAndWait()
                 data, sample_rate = sf.read(tmp_path, dtype="float32", always_2d=False)
             finally:
                 try:
                     os.unlink(tmp_path)
                 except OSError:
                     pass
-            if data.ndim > 1:
-                data = data.mean(axis=1)
             if data.size == 0:
                 return None
-            return self._normalise(data), sample_rate
+            return _finalise(data, channel_axis=1)[0], sample_rate
         except Exception:
             self.logger.exception("pyttsx3 synthesis failed")
             return None
 
-    @staticmethod
-    def _normalise(audio: np.ndarray) -> np.ndarray:
-        peak = float(np.max(np.abs(audio))) if audio.size else 0.0
-        if peak > 1e-4:
-            return (audio / peak).astype(np.float32)
-        return audio.astype(np.float32)
-
 
 class PipelineRegistry:
     """Caches initialised pipelines so each language is loaded once."""
 
     def __init__(self) -> None:
         self._pipelines: Dict[str, TranslationPipeline] = {}
+        self._lock = threading.Lock()
+        self._load_locks: Dict[str, threading.Lock] = {}
 
     def get(self, language: str) -> TranslationPipeline:
-        if language not in LANGUAGE_CONFIG:
+        pipeline = self._pipelines.get(language)
+        if pipeline is not None:
+            return pipeline
+        spec = LANG_SPECS.get(language)
+        if spec is None:
             raise ValueError(f"Unsupported language: {language}")
-        if language not in self._pipelines:
-            self._pipelines[language] = TranslationPipeline(language)
-        return self._pipelines[language]
+        # Per-language locks let different languages load concurrently while a given
+        # language is only ever built once.
+        with self._lock:
+            load_lock = self._load_locks.setdefault(spec.key, threading.Lock())
+        with load_lock:
+            if spec.key not in self._pipelines:
+                self._pipelines[spec.key] = TranslationPipeline(spec.key)
+        return self._pipelines[spec.key]
 
     def loaded_languages(self) -> List[str]:
         return list(self._pipelines.keys())
@@ -256,4 +556,4 @@ class PipelineRegistry:
 
 pipelines = PipelineRegistry()
 
-__all__ = ["TranslationPipeline", "pipelines"]
+__all__ = ["TranslationPipeline", "decode_audio_bytes", "pipelines"]
@@ -9,7 +9,6 @@ from pathlib import Path
 from typing import Optional, Tuple
 
 import numpy as np
-import soundfile as sf
 
 try:
     from TTS.api import TTS as CoquiTTS  # type: ignore
@@ -25,22 +24,23 @@ try:
 except Exception:  # pragma: no cover
     CoquiTTS = None  # type: ignore
 
-from .config import XTTS_MODEL_NAME, XTTS_USE_GPU
+from .config import XTTS_MAX_CONCURRENCY, XTTS_MODEL_NAME, XTTS_USE_GPU
 
 logger = logging.getLogger(__name__)
 
 
 class XTTSAdapter:
-    """Thin wrapper around Coqui XTTS with thread-safe synthesis."""
+    """Thin wrapper around Coqui XTTS with bounded concurrent synthesis."""
 
-    def __init__(self, model_name: str, use_gpu: bool) -> None:
+    def __init__(self, model_name: str, use_gpu: bool, max_concurrency: int = 1) -> None:
         if CoquiTTS is None:
             raise RuntimeError("Coqui TTS is not installed. Install the `TTS` package to enable XTTS.")
         logger.info("Loading XTTS model %s (gpu=%s)", model_name, use_gpu)
         self.tts = CoquiTTS(model_name, gpu=use_gpu)
         self.model_name = model_name
         self.use_gpu = use_gpu
-        self._lock = threading.Lock()
+        self.max_concurrency = max_concurrency if use_gpu else 1
+        self._sem = threading.BoundedSemaphore(self.max_concurrency)
 
     def synthesize(
         self,
@@ -61,29 +61,19 @@ class XTTSAdapter:
         elif default_sample:
             speaker_path = str(default_sample)
 
-        with tempfile.NamedTemporaryFile(delete=False, suffix=".wav") as tmp_out:
-            output_path = tmp_out.name
-
         kwargs = {
             "text": text,
             "language": language,
-            "file_path": output_path,
         }
         if speaker_path:
             kwargs["speaker_wav"] = speaker_path
 
         try:
-            with self._lock:
-                self.tts.tts_to_file(**kwargs)
-            data, sample_rate = sf.read(output_path, dtype="float32", always_2d=False)
-            if data.ndim > 1:
-                data = data.mean(axis=1)
-            return data.astype(np.float32), int(sample_rate)
+            with self._sem:
+                wav = self.tts.tts(**kwargs)
+            sample_rate = self.tts.synthesizer.output_sample_rate
+            return np.asarray(wav, dtype=np.float32), int(sample_rate)
         finally:
-            try:
-                os.unlink(output_path)
-            except OSError:
-                logger.warning("Failed to delete temporary XTTS output file %s", output_path)
             if temp_speaker_path:
                 try:
                     os.unlink(temp_speaker_path)
@@ -106,7 +96,7 @@ def get_xtts_adapter() -> Optional[XTTSAdapter]:
     with _adapter_lock:
         if _adapter is None:
             try:
-                _adapter = XTTSAdapter(XTTS_MODEL_NAME, XTTS_USE_GPU)
+                _adapter = XTTSAdapter(XTTS_MODEL_NAME, XTTS_USE_GPU, XTTS_MAX_CONCURRENCY)
             except Exception:
                 logger.exception("Failed to initialise XTTS adapter.")
                 _adapter = None
@@ -8,62 +8,262 @@ Example:
         --translation-model Helsinki-NLP/opus-mt-en-es \
         --output-dir models/opus-mt-en-es \
         --quantization int8
+
+Repeat --quantization to emit several variants from a single checkpoint load, or pass
+--models-file with one model ID per line to convert a batch in parallel.
 """
 from __future__ import annotations
 
 import argparse
+import copy
+import fnmatch
+import functools
+import hashlib
+import json
+import multiprocessing
+import os
+import re
+import shlex
 import shutil
+import signal
+import stat
 import subprocess
 import sys
+import threading
+from concurrent.futures import FIRST_EXCEPTION, Future, ThreadPoolExecutor, wait
+from contextlib import ExitStack, contextmanager
 from pathlib import Path
+from typing import Iterator
+
+
+# ct2-transformers-converter options accepted by TransformersConverter.__init__ / .convert.
+CONVERTER_INIT_OPTIONS = {
+    "activation_scales": str,
+    "load_as_float16": bool,
+    "trust_remote_code": bool,
+}
+CONVERT_OPTIONS = {"vmap": str}
+
+# config.json activation_function values the --no-torch converter maps to ctranslate2 activations.
+NO_TORCH_ACTIVATIONS = {"gelu": "GELU", "relu": "RELU", "silu": "SWISH", "swish": "SWISH"}
+
+# Tokenizer/generation files copied next to model.bin when the checkpoint has them.
+AUX_FILES = [
+    "tokenizer.json",
+    "tokenizer_config.json",
+    "sentencepiece.bpe.model",
+    "special_tokens_map.json",
+    "vocab.json",
+    "source.spm",
+    "target.spm",
+    "generation_config.json",
+]
+
+CONVERSION_META = "conversion_meta.json"
+
+# Files the converter (and write_conversion_meta) writes; --copy-glob must never overwrite them.
+CONVERTER_OUTPUTS = ("config.json", "model.bin", "*vocabulary*", CONVERSION_META)
+
+# Progress lines of the form "Converting <name> (i/n)" emitted by the converter CLI.
+CONVERTER_PROGRESS = re.compile(r"Converting (\S+) \((\d+)/(\d+)\)")
+
+
+@functools.lru_cache(maxsize=None)
+def _status_console():
+    # rich pulls in pygments/markdown-it; import it only once there is something to print.
+    from rich.console import Console
+
+    # Status goes to stderr so stdout carries nothing but --dry-run's JSON plan.
+    return Console(stderr=True)
+
+
+def _rich_print(*args: object, **kwargs: object) -> None:
+    _status_console().print(*args, **kwargs)
+
 
-from huggingface_hub import snapshot_download
-from rich import print
+def _load_app_config():
+    """Load app/config.py on its own.
 
-from app.config import TRANSLATION_MODEL_DIR, TRANSLATION_MODEL_ID
+    Importing it as ``app.config`` runs ``app/__init__``, which pulls in transformers, torch
+    and huggingface_hub (whose constants read HF_HUB_ENABLE_HF_TRANSFER at import time)
+    before the download backend is configured and before the batch pool forks.
+    """
+    import importlib.util
+
+    spec = importlib.util.spec_from_file_location("_app_config", Path(__file__).resolve().parent / "app" / "config.py")
+    config = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(config)
+    return config
 
 
 def parse_args() -> argparse.Namespace:
-    parser = argparse.ArgumentParser(description="Download and convert translation models for offline inference.")
+    parser = argparse.ArgumentParser(
+        description="Download and convert translation models for offline inference.",
+        allow_abbrev=False,
+    )
+    # Defaults for these two come from app/config.py, which is only loaded after parsing
+    # so that --help stays fast.
     parser.add_argument(
         "--translation-model",
-        default=TRANSLATION_MODEL_ID,
-        help=f"Hugging Face model ID (default: {TRANSLATION_MODEL_ID}).",
+        default=None,
+        help="Hugging Face model ID (default: TRANSLATION_MODEL_ID from app/config.py).",
     )
     parser.add_argument(
         "--output-dir",
-        default=str(TRANSLATION_MODEL_DIR),
-        help=f"Directory where the converted CTranslate2 model will be stored (default: {TRANSLATION_MODEL_DIR}).",
+        default=None,
+        help="Directory where the converted CTranslate2 model will be stored "
+        "(default: TRANSLATION_MODEL_DIR from app/config.py). With --models-file, the directory "
+        "each model is converted into a <org>--<name> subdirectory of (default: its parent).",
+    )
+    parser.add_argument(
+        "--models-file",
+        default=None,
+        metavar="PATH",
+        help="Convert every Hugging Face model ID listed in PATH (one per line, '#' starts a comment) "
+        "instead of --translation-model.",
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=max(1, (os.cpu_count() or 1) // 2),
+        metavar="N",
+        help="Number of models converted concurrently with --models-file (default: %(default)s).",
     )
     parser.add_argument(
         "--cache-dir",
         default=None,
         help="Optional cache directory for downloaded Hugging Face files.",
     )
+    parser.add_argument(
+        "--local-dir",
+        default=None,
+        metavar="PATH",
+        help="Also place the downloaded files in PATH, hard-linked (or copied when linking fails) "
+        "from the Hugging Face cache, and convert from there.",
+    )
     parser.add_argument(
         "--revision",
         default="main",
-        help="Model revision to download (default: main).",
+        help="Model revision to download (default: %(default)s).",
     )
     parser.add_argument(
         "--quantization",
-        default="int8",
-        choices=["float32", "float16", "int8", "int8_float16", "int16"],
-        help="CTranslate2 quantization type (default: int8).",
+        action="append",
+        default=None,
+        choices=["auto", "float32", "float16", "bfloat16", "int8", "int8_float16", "int8_bfloat16", "int16"],
+        help="CTranslate2 quantization type; 'auto' picks the fastest int8 variant this host "
+        "supports (default: int8_float16). Repeat to convert several variants while loading the "
+        "checkpoint once; the first one is what --output-dir points at.",
     )
     parser.add_argument(
         "--force",
         action="store_true",
         help="Overwrite the output directory if it already exists.",
     )
+    parser.add_argument(
+        "--parallel",
+        action=argparse.BooleanOptionalAction,
+        default=True,
+        help="Download with hf_transfer and parallel chunked transfers when available (default: on).",
+    )
+    parser.add_argument(
+        "--max-workers",
+        type=int,
+        default=min(16, (os.cpu_count() or 1) * 2),
+        metavar="N",
+        help="Number of files downloaded concurrently (default: %(default)s).",
+    )
+    parser.add_argument(
+        "--verify",
+        action=argparse.BooleanOptionalAction,
+        default=True,
+        help="Check downloaded weight files against the Hub's SHA-256 before converting (default: on).",
+    )
+    parser.add_argument(
+        "--preflight",
+        action=argparse.BooleanOptionalAction,
+        default=True,
+        help="Check free RAM and disk against the checkpoint size before converting (default: on).",
+    )
+    parser.add_argument(
+        "--keep-hf-cache",
+        action=argparse.BooleanOptionalAction,
+        default=False,
+        help="Keep the downloaded Hugging Face snapshot in the cache after a successful conversion "
+        "(default: off, so re-converting downloads the checkpoint again; ignored with --local-dir).",
+    )
+    parser.add_argument(
+        "--copy-glob",
+        action="append",
+        default=[],
+        metavar="PATTERN",
+        help="Also copy snapshot files matching PATTERN (e.g. '*.spm') into the converted model; "
+        "may be repeated. Known tokenizer files (" + ", ".join(AUX_FILES) + ") are always copied "
+        "when present.",
+    )
     parser.add_argument(
         "--converter-arg",
         action="append",
         default=[],
         metavar="ARG",
-        help="Additional argument passed through to ct2-transformers-converter (may be repeated).",
+        help="Additional converter option as --key[=value] (may be repeated). In-process conversion "
+        "accepts " + ", ".join(f"--{name}" for name in sorted(CONVERTER_INIT_OPTIONS | CONVERT_OPTIONS))
+        + "; --use-cli passes any option through to ct2-transformers-converter.",
     )
-    return parser.parse_args()
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="Resolve the revision and print the conversion plan (sizes, estimated RAM/disk, outputs) "
+        "as JSON without downloading weights or converting.",
+    )
+    parser.add_argument(
+        "--use-cli",
+        action="store_true",
+        help="Convert by invoking the ct2-transformers-converter executable instead of in-process.",
+    )
+    parser.add_argument(
+        "--no-torch",
+        action="store_true",
+        help="Never import torch: convert Marian (e.g. opus-mt) safetensors checkpoints with numpy, and "
+        "anything else (or bfloat16 quantizations) with ct2-transformers-converter in a subprocess.",
+    )
+    parser.add_argument(
+        "--verbose",
+        action="store_true",
+        help="Print the full converter command line (with --use-cli).",
+    )
+    args = parser.parse_args()
+    if args.output_dir is None or (args.translation_model is None and not args.models_file):
+        config = _load_app_config()
+        args.translation_model = args.translation_model or config.TRANSLATION_MODEL_ID
+        default_output = config.TRANSLATION_MODEL_DIR.parent if args.models_file else config.TRANSLATION_MODEL_DIR
+        args.output_dir = args.output_dir or str(default_output)
+    return args
+
+
+def configure_download_backend(parallel: bool) -> None:
+    """Select the Hugging Face download backend; must run before huggingface_hub is imported."""
+    if parallel:
+        os.environ.setdefault("HF_HUB_ENABLE_HF_TRANSFER", "1")
+        os.environ.setdefault("HF_ENABLE_PARALLEL_DOWNLOADING", "true")
+        try:
+            import hf_transfer  # noqa: F401
+        except ImportError:
+            _rich_print("[yellow]hf_transfer is not installed; using the default download backend.[/yellow]")
+            os.environ["HF_HUB_ENABLE_HF_TRANSFER"] = "0"
+    else:
+        os.environ["HF_HUB_ENABLE_HF_TRANSFER"] = "0"
+        os.environ["HF_ENABLE_PARALLEL_DOWNLOADING"] = "false"
+
+
+def disable_torch_import() -> None:
+    """Make ``import torch`` fail for the rest of this process (--no-torch).
+
+    ctranslate2's converters and specs try to import torch at module level and only use it
+    when that succeeds, so this must run before ctranslate2 is first imported.
+    """
+    if "torch" not in sys.modules:
+        sys.modules["torch"] = None
 
 
 def ensure_converter_cli() -> None:
@@ -74,13 +274,651 @@ def ensure_converter_cli() -> None:
         )
 
 
+def resolve_quantization(quantization: str) -> str:
+    """Resolve ``auto`` to int8_bfloat16, int8_float16 or int8 based on host support."""
+    if quantization != "auto":
+        return quantization
+    import ctranslate2
+
+    supported: set[str] = set(ctranslate2.get_supported_compute_types("cpu"))
+    try:
+        if ctranslate2.get_cuda_device_count() > 0:
+            supported |= set(ctranslate2.get_supported_compute_types("cuda"))
+    except Exception:
+        pass
+    for candidate in ("int8_bfloat16", "int8_float16", "int8"):
+        if candidate in supported:
+            resolved = candidate
+            break
+    else:
+        resolved = "int8"
+    _rich_print(f"[cyan]Resolved --quantization auto to {resolved}[/cyan]")
+    return resolved
+
+
+def prepare_converter(use_cli: bool) -> None:
+    """Import the converter stack while the download runs.
+
+    Importing torch/transformers for the in-process converter takes seconds; doing it
+    on a background thread hides that cost behind network time.
+    """
+    if not use_cli:
+        try:
+            import torch  # noqa: F401
+        except ImportError:
+            pass
+        from ctranslate2.converters import TransformersConverter  # noqa: F401
+
+
+def cached_snapshot(repo_id: str, revision: str, cache_dir: str | None) -> Path | None:
+    """Return the cached snapshot for ``revision`` if its config and weights are all on disk.
+
+    Only the local cache (including its refs/ files) is consulted, so a warm run makes
+    no network requests.
+    """
+    from huggingface_hub import try_to_load_from_cache
+
+    config_path = try_to_load_from_cache(
+        repo_id, filename="config.json", revision=revision, cache_dir=cache_dir
+    )
+    if not isinstance(config_path, str):
+        return None
+    snapshot = Path(config_path).parent
+    for index_name in ("model.safetensors.index.json", "pytorch_model.bin.index.json"):
+        index_file = snapshot / index_name
+        if index_file.exists():
+            shards = set(json.loads(index_file.read_text())["weight_map"].values())
+            return snapshot if all((snapshot / shard).exists() for shard in shards) else None
+    if (snapshot / "model.safetensors").exists() or (snapshot / "pytorch_model.bin").exists():
+        return snapshot
+    return None
+
+
+def model_slug(repo_id: str) -> str:
+    return repo_id.replace("/", "--")
+
+
+def versions_root(output_dir: Path) -> Path:
+    """Directory next to ``output_dir`` that holds one converted model per revision."""
+    return output_dir.with_name(f"{output_dir.name}.versions")
+
+
+def resolve_revision_sha(repo_id: str, revision: str, cached: Path | None) -> str:
+    """Commit sha for ``revision``; taken from the cached snapshot name when available."""
+    if cached is not None:
+        return cached.name
+    from huggingface_hub import HfApi
+
+    return HfApi().repo_info(repo_id, revision=revision).sha
+
+
+def is_up_to_date(version_dir: Path, revision_sha: str, quantization: str) -> bool:
+    """Check ``version_dir`` holds a conversion of this revision by the installed converter."""
+    meta_file = version_dir / CONVERSION_META
+    if not (version_dir / "model.bin").exists() or not meta_file.exists():
+        return False
+    try:
+        meta = json.loads(meta_file.read_text())
+    except (OSError, ValueError):
+        return False
+    import ctranslate2
+
+    return (
+        meta.get("sha") == revision_sha
+        and meta.get("quantization") == quantization
+        and meta.get("ct2_version") == ctranslate2.__version__
+    )
+
+
+def write_conversion_meta(version_dir: Path, repo_id: str, revision_sha: str, quantization: str) -> None:
+    import ctranslate2
+
+    meta = {
+        "model_id": repo_id,
+        "sha": revision_sha,
+        "quantization": quantization,
+        "ct2_version": ctranslate2.__version__,
+    }
+    (version_dir / CONVERSION_META).write_text(json.dumps(meta, indent=2))
+
+
+def point_output_at(output_dir: Path, version_dir: Path) -> None:
+    """Atomically (re)point the ``output_dir`` symlink at ``version_dir``.
+
+    A pre-existing real directory or file (e.g. the layout before content-addressed
+    outputs) is removed first; check_output_links() only lets that through with --force.
+    """
+    if output_dir.is_dir() and not output_dir.is_symlink():
+        shutil.rmtree(output_dir)
+    elif output_dir.exists() and not output_dir.is_symlink():
+        output_dir.unlink()
+    tmp_link = output_dir.with_name(f"{output_dir.name}.link.{os.getpid()}")
+    tmp_link.unlink(missing_ok=True)
+    # Relative, so the models directory can be moved or mounted elsewhere.
+    tmp_link.symlink_to(os.path.relpath(version_dir, output_dir.parent), target_is_directory=True)
+    os.replace(tmp_link, output_dir)
+
+
+def output_links(output_dir: Path, version_dirs: dict[str, Path]) -> dict[Path, Path]:
+    """Map each symlink to maintain to its version dir.
+
+    ``output_dir`` points at the first variant; multi-variant runs also get a
+    ``<output_dir>-<quantization>`` link per variant.
+    """
+    variants = list(version_dirs.items())
+    links = {output_dir: variants[0][1]}
+    if len(variants) > 1:
+        for quantization, version_dir in variants:
+            links[output_dir.with_name(f"{output_dir.name}-{quantization}")] = version_dir
+    return links
+
+
+def check_output_links(links: dict[Path, Path], force: bool) -> None:
+    """Exit unless every link path is free or already a symlink (anything else needs --force)."""
+    for link in links:
+        try:
+            link_stat = os.lstat(link)
+        except FileNotFoundError:
+            continue
+        if not stat.S_ISLNK(link_stat.st_mode) and not force:
+            _rich_print(f"[red]Output directory {link} already exists. Use --force to overwrite.[/red]")
+            sys.exit(1)
+
+
+def point_outputs_at(links: dict[Path, Path]) -> None:
+    for link, version_dir in links.items():
+        point_output_at(link, version_dir)
+
+
+def _hf_cache_paths(repo_id: str, cache_dir: str | None) -> tuple[Path, Path]:
+    """Return the (cache root, repo folder) ``repo_id`` is cached under."""
+    from huggingface_hub.constants import HF_HUB_CACHE
+    from huggingface_hub.file_download import repo_folder_name
+
+    cache_root = Path(cache_dir or HF_HUB_CACHE).expanduser().resolve()
+    return cache_root, cache_root / repo_folder_name(repo_id=repo_id, repo_type="model")
+
+
+def record_revision_ref(repo_id: str, revision: str, revision_sha: str, cache_dir: str | None) -> None:
+    """Point the cache's ``refs/<revision>`` at ``revision_sha``.
+
+    snapshot_download only writes the ref when asked for a branch or tag, not a commit
+    sha; cached_snapshot() resolves ``--revision`` through it, so without the ref every
+    rerun would need the network.
+    """
+    if revision == revision_sha:
+        return
+    ref_file = _hf_cache_paths(repo_id, cache_dir)[1] / "refs" / revision
+    ref_file.parent.mkdir(parents=True, exist_ok=True)
+    ref_file.write_text(revision_sha)
+
+
+def prune_hf_cache(repo_id: str, cache_dir: str | None) -> None:
+    """Delete ``repo_id``'s folder from the Hugging Face cache once it has been converted."""
+    cache_root, repo_dir = _hf_cache_paths(repo_id, cache_dir)
+    repo_dir = repo_dir.resolve()
+    # resolve() follows a symlinked repo folder; never delete anything outside the cache.
+    if repo_dir == cache_root or not repo_dir.is_relative_to(cache_root):
+        _rich_print(f"[yellow]Not removing {repo_dir}: it is outside the cache at {cache_root}.[/yellow]")
+        return
+    if repo_dir.is_dir():
+        _rich_print(f"[cyan]Removing cached snapshot {repo_dir} (pass --keep-hf-cache to keep it)...[/cyan]")
+        shutil.rmtree(repo_dir, ignore_errors=True)
+
+
+def _available_memory() -> int | None:
+    """Available RAM in bytes, or None when it cannot be determined."""
+    try:
+        import psutil
+    except ImportError:
+        psutil = None
+    if psutil is not None:
+        return int(psutil.virtual_memory().available)
+    try:
+        with open("/proc/meminfo") as meminfo:
+            for line in meminfo:
+                if line.startswith("MemAvailable:"):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+    return None
+
+
+def conversion_requirements(
+    model_bytes: int, torch_dtype: str | None, variants: int = 1, use_cli: bool = False
+) -> tuple[int, int]:
+    """Estimated (peak RAM, free disk) in bytes to convert a ``model_bytes`` checkpoint."""
+    # The converter materialises the weights (in float32 for float32 checkpoints) before quantizing.
+    ram_factor = 0.8 if torch_dtype in ("float16", "bfloat16") else 1.2
+    # In-process multi-variant runs keep the unquantized spec alongside the copy being quantized.
+    if variants > 1 and not use_cli:
+        ram_factor *= 2
+    return int(ram_factor * model_bytes), (1 + variants) * model_bytes
+
+
+def preflight_check(download_path: Path, output_parent: Path, variants: int = 1, use_cli: bool = False) -> None:
+    """Fail fast when the conversion is likely to be OOM-killed or run out of disk."""
+    weights = list(download_path.glob("*.safetensors")) or list(download_path.glob("*.bin"))
+    model_bytes = sum(path.stat().st_size for path in weights)
+    if not model_bytes:
+        return
+    try:
+        torch_dtype = json.loads((download_path / "config.json").read_text()).get("torch_dtype")
+    except (OSError, ValueError):
+        torch_dtype = None
+    needed_ram, needed_disk = conversion_requirements(model_bytes, torch_dtype, variants, use_cli)
+    gib = 1024**3
+    problems = []
+    available = _available_memory()
+    if available is not None and available < needed_ram:
+        problems.append(
+            f"needs ~{needed_ram / gib:.1f} GiB of RAM but only {available / gib:.1f} GiB is "
+            "available. Free memory, or pass --converter-arg=--load_as_float16 to lower the "
+            "converter's peak memory"
+        )
+    free_disk = shutil.disk_usage(output_parent).free
+    if free_disk < needed_disk:
+        problems.append(
+            f"needs ~{needed_disk / gib:.1f} GiB of free disk under {output_parent} but only "
+            f"{free_disk / gib:.1f} GiB is free"
+        )
+    if problems:
+        for problem in problems:
+            _rich_print(f"[red]Preflight: converting a {model_bytes / gib:.1f} GiB checkpoint {problem}.[/red]")
+        _rich_print("[red]Re-run with --no-preflight to convert anyway.[/red]")
+        sys.exit(2)
+
+
+def plan_conversion(args: argparse.Namespace, output_dir: Path, quantizations: list[str]) -> dict[str, object]:
+    """Describe what a run would do, fetching only the repo metadata and config.json."""
+    from huggingface_hub import HfApi, hf_hub_download
+
+    info = HfApi().model_info(args.translation_model, revision=args.revision, files_metadata=True)
+    siblings = info.siblings or []
+    weights = [s for s in siblings if s.rfilename.endswith(".safetensors")] or [
+        s for s in siblings if s.rfilename.endswith(".bin")
+    ]
+    model_bytes = sum(s.size or 0 for s in weights)
+    config_path = hf_hub_download(
+        args.translation_model, filename="config.json", revision=info.sha, cache_dir=args.cache_dir
+    )
+    config = json.loads(Path(config_path).read_text())
+    needed_ram, needed_disk = conversion_requirements(
+        model_bytes, config.get("torch_dtype"), len(quantizations), args.use_cli
+    )
+    root = versions_root(output_dir)
+    plan = {
+        "model_id": args.translation_model,
+        "revision": args.revision,
+        "sha": info.sha,
+        "model_type": config.get("model_type"),
+        "architectures": config.get("architectures"),
+        "torch_dtype": config.get("torch_dtype"),
+        "download_bytes": sum(s.lfs.size if s.lfs is not None else s.size or 0 for s in siblings),
+        "weight_bytes": model_bytes,
+        "estimated_peak_ram_bytes": needed_ram,
+        "estimated_disk_bytes": needed_disk,
+        "converter": plan_converter(args, config, [s.rfilename for s in siblings], quantizations),
+        "output_dir": str(output_dir),
+        "outputs": {
+            quantization: str(root / f"{model_slug(args.translation_model)}@{info.sha}-{quantization}")
+            for quantization in quantizations
+        },
+    }
+    return plan
+
+
+def plan_converter(
+    args: argparse.Namespace, config: dict[str, object], filenames: list[str], quantizations: list[str]
+) -> str:
+    if args.use_cli:
+        return "ct2-transformers-converter"
+    if not args.no_torch:
+        return "TransformersConverter"
+    if no_torch_unsupported(config, filenames, quantizations) is None:
+        return "safetensors (no torch)"
+    return "ct2-transformers-converter"
+
+
+def print_json(data: object) -> None:
+    """Write ``data`` as JSON to stdout in one go."""
+    from rich import print_json as rich_print_json
+
+    rich_print_json(data=data)
+
+
+def converter_kwargs(extra_args: list[str]) -> tuple[dict[str, object], dict[str, object]]:
+    """Split ``--key[=value]`` converter options into (constructor, convert) keyword arguments."""
+    init_kwargs: dict[str, object] = {}
+    convert_kwargs: dict[str, object] = {}
+    for arg in extra_args:
+        key, has_value, value = arg.lstrip("-").partition("=")
+        key = key.replace("-", "_")
+        if key in CONVERTER_INIT_OPTIONS:
+            target, kind = init_kwargs, CONVERTER_INIT_OPTIONS[key]
+        elif key in CONVERT_OPTIONS:
+            target, kind = convert_kwargs, CONVERT_OPTIONS[key]
+        else:
+            raise SystemExit(
+                f"[red]Unsupported converter argument {arg!r}. Use --use-cli to pass it to "
+                "ct2-transformers-converter.[/red]"
+            )
+        if kind is bool:
+            target[key] = value.strip().lower() in {"1", "true", "yes", "on"} if has_value else True
+        elif not has_value:
+            raise SystemExit(f"[red]Converter argument {arg!r} requires a value (--{key}=VALUE).[/red]")
+        else:
+            target[key] = value
+    return init_kwargs, convert_kwargs
+
+
+def _terminate(proc: subprocess.Popen) -> None:
+    proc.terminate()
+    try:
+        proc.wait(5)
+    except subprocess.TimeoutExpired:
+        proc.kill()
+        proc.wait()
+
+
+def run_converter_cli(cmd: list[str]) -> None:
+    """Run the converter CLI, streaming its output into a progress bar.
+
+    Ctrl-C terminates (then kills) the child instead of leaving it running, and a non-zero
+    exit raises CalledProcessError like ``subprocess.run(check=True)``.
+    """
+    from rich.progress import BarColumn, Progress, SpinnerColumn, TextColumn
+
+    proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, bufsize=1, text=True)
+    previous_handler = signal.getsignal(signal.SIGINT)
+
+    def _abort(signum, frame):
+        _terminate(proc)
+        raise KeyboardInterrupt
+
+    signal.signal(signal.SIGINT, _abort)
+    try:
+        with Progress(
+            SpinnerColumn(), TextColumn("{task.description}"), BarColumn(), console=_status_console()
+        ) as progress:
+            task = progress.add_task("Converting", total=None)
+            assert proc.stdout is not None
+            for line in proc.stdout:
+                match = CONVERTER_PROGRESS.search(line)
+                if match:
+                    progress.update(
+                        task,
+                        description=f"Converting {match[1]}",
+                        completed=int(match[2]),
+                        total=int(match[3]),
+                    )
+                elif line.strip():
+                    progress.console.print(line.rstrip(), markup=False, highlight=False)
+        returncode = proc.wait()
+    finally:
+        signal.signal(signal.SIGINT, previous_handler)
+        if proc.poll() is None:
+            _terminate(proc)
+    if returncode:
+        raise subprocess.CalledProcessError(returncode, cmd)
+
+
+def aux_files(model_dir: Path, copy_globs: list[str]) -> list[str]:
+    """Names of the tokenizer/aux files in ``model_dir`` to copy next to the converted model."""
+    names = [name for name in AUX_FILES if (model_dir / name).is_file()]
+    for pattern in copy_globs:
+        names.extend(
+            path.name
+            for path in sorted(model_dir.glob(pattern))
+            if path.is_file() and not any(fnmatch.fnmatch(path.name, output) for output in CONVERTER_OUTPUTS)
+        )
+    return list(dict.fromkeys(names))
+
+
+def copy_aux_files(model_dir: Path, names: list[str], output_dir: Path) -> None:
+    """Copy ``names`` from ``model_dir`` into ``output_dir``.
+
+    On Linux a single ``cp --reflink=auto`` clones the files on copy-on-write filesystems
+    (btrfs, XFS) and falls back to an in-kernel copy elsewhere; shutil.copyfile (which
+    uses sendfile/fcopyfile) covers other platforms and a failing cp.
+    """
+    if not names:
+        return
+    if sys.platform.startswith("linux") and shutil.which("cp"):
+        sources = [str(model_dir / name) for name in names]
+        try:
+            subprocess.run(["cp", "--reflink=auto", *sources, str(output_dir)], check=True, stderr=subprocess.DEVNULL)
+            return
+        except (OSError, subprocess.CalledProcessError):
+            pass
+    for name in names:
+        shutil.copyfile(model_dir / name, output_dir / name)
+
+
+def no_torch_unsupported(config: dict[str, object], filenames: list[str], quantizations: list[str]) -> str | None:
+    """Return why the --no-torch converter cannot convert this checkpoint, or None if it can."""
+    if config.get("model_type") != "marian":
+        return f"model_type {config.get('model_type')!r} is not supported (only 'marian')"
+    if not config.get("share_encoder_decoder_embeddings", True):
+        return "separate source and target vocabularies are not supported"
+    if config.get("activation_function", "gelu") not in NO_TORCH_ACTIVATIONS:
+        return f"activation {config.get('activation_function')!r} is not supported"
+    if (config.get("dtype") or config.get("torch_dtype")) not in (None, "float32", "float16"):
+        return f"{config.get('dtype') or config.get('torch_dtype')} weights need torch"
+    if not any(name.endswith(".safetensors") for name in filenames):
+        return "the checkpoint has no safetensors weights"
+    if "vocab.json" not in filenames:
+        return "vocab.json is missing"
+    if any("bfloat16" in quantization for quantization in quantizations):
+        return "bfloat16 quantization needs torch"
+    return None
+
+
+def _marian_position_encodings(num_positions: int, dim: int, dtype):
+    """Sinusoidal encodings as MarianSinusoidalPositionalEmbedding builds them (cosines in the second half)."""
+    import numpy as np
+
+    angles = np.arange(num_positions)[:, None] / np.power(10000, 2 * (np.arange(dim) // 2) / dim)
+    encodings = np.empty((num_positions, dim), dtype=np.float32)
+    sentinel = (dim + 1) // 2
+    encodings[:, :sentinel] = np.sin(angles[:, 0::2])
+    encodings[:, sentinel:] = np.cos(angles[:, 1::2])
+    return encodings.astype(dtype, copy=False)
+
+
+def _marian_spec_from_safetensors(model_dir: Path):
+    """Build the TransformerSpec MarianMTLoader would, reading the weights with numpy instead of torch."""
+    import math
+
+    import numpy as np
+    from ctranslate2.specs import common_spec, transformer_spec
+    from safetensors import safe_open
+
+    config = json.loads((model_dir / "config.json").read_text())
+    tokenizer_config_path = model_dir / "tokenizer_config.json"
+    tokenizer_config = json.loads(tokenizer_config_path.read_text()) if tokenizer_config_path.exists() else {}
+    dtype = config.get("dtype") or config.get("torch_dtype")
+
+    weights = {}
+    for shard in sorted(model_dir.glob("*.safetensors")):
+        with safe_open(str(shard), framework="numpy") as f:
+            for key in f.keys():
+                tensor = f.get_tensor(key)
+                weights[key.removeprefix("model.")] = tensor.astype(dtype, copy=False) if dtype else tensor
+    # Tied embeddings are saved once, under whichever of these names the exporter kept.
+    shared = next(
+        weights[key]
+        for key in ("shared.weight", "encoder.embed_tokens.weight", "decoder.embed_tokens.weight", "lm_head.weight")
+        if key in weights
+    )
+
+    def set_linear(spec, prefix):
+        spec.weight = weights[f"{prefix}.weight"]
+        if f"{prefix}.bias" in weights:
+            spec.bias = weights[f"{prefix}.bias"]
+
+    def set_layer_norm(spec, prefix):
+        spec.gamma = weights[f"{prefix}.weight"]
+        spec.beta = weights[f"{prefix}.bias"]
+
+    def set_attention(spec, prefix, self_attention):
+        q, k, v = (f"{prefix}.{name}_proj" for name in "qkv")
+        fused = [[q, k, v]] if self_attention else [[q], [k, v]]
+        for linear_spec, names in zip(spec.linear, fused):
+            linear_spec.weight = np.concatenate([weights[f"{name}.weight"] for name in names])
+            linear_spec.bias = np.concatenate([weights[f"{name}.bias"] for name in names])
+        set_linear(spec.linear[-1], f"{prefix}.out_proj")
+
+    def set_stack(spec, prefix, embeddings, cross_attention):
+        spec.scale_embeddings = math.sqrt(config["d_model"]) if config.get("scale_embedding") else 1.0
+        spec.position_encodings.encodings = _marian_position_encodings(
+            config["max_position_embeddings"], config["d_model"], shared.dtype
+        )
+        embeddings.weight = shared[:-1]
+        for index, layer_spec in enumerate(spec.layer):
+            layer = f"{prefix}.layers.{index}"
+            set_attention(layer_spec.self_attention, f"{layer}.self_attn", self_attention=True)
+            set_layer_norm(layer_spec.self_attention.layer_norm, f"{layer}.self_attn_layer_norm")
+            if cross_attention:
+                set_attention(layer_spec.attention, f"{layer}.encoder_attn", self_attention=False)
+                set_layer_norm(layer_spec.attention.layer_norm, f"{layer}.encoder_attn_layer_norm")
+            set_linear(layer_spec.ffn.linear_0, f"{layer}.fc1")
+            set_linear(layer_spec.ffn.linear_1, f"{layer}.fc2")
+            set_layer_norm(layer_spec.ffn.layer_norm, f"{layer}.final_layer_norm")
+
+    spec = transformer_spec.TransformerSpec.from_config(
+        (config["encoder_layers"], config["decoder_layers"]),
+        config["encoder_attention_heads"],
+        pre_norm=False,
+        activation=getattr(common_spec.Activation, NO_TORCH_ACTIVATIONS[config.get("activation_function", "gelu")]),
+        layernorm_embedding=False,
+    )
+    # As in MarianMTLoader, the last vocabulary row is the <pad> Transformers adds to start the
+    # decoder from; ctranslate2 starts from a zero embedding instead, so the row is dropped.
+    set_stack(spec.encoder, "encoder", spec.encoder.embeddings[0], cross_attention=False)
+    set_stack(spec.decoder, "decoder", spec.decoder.embeddings, cross_attention=True)
+    spec.decoder.start_from_zero_embedding = True
+    spec.decoder.projection.weight = weights.get("lm_head.weight", shared)[:-1]
+    final_logits_bias = weights.get("final_logits_bias")
+    if final_logits_bias is not None and final_logits_bias.any():
+        spec.decoder.projection.bias = final_logits_bias.squeeze()[:-1]
+
+    def special_token(name, default):
+        token = tokenizer_config.get(name) or default
+        return token["content"] if isinstance(token, dict) else token
+
+    spec.config.eos_token = special_token("eos_token", "</s>")
+    spec.config.unk_token = special_token("unk_token", "<unk>")
+    spec.config.decoder_start_token = spec.config.eos_token
+
+    vocab = json.loads((model_dir / "vocab.json").read_text())
+    for token_id, token in tokenizer_config.get("added_tokens_decoder", {}).items():
+        vocab[token["content"]] = int(token_id)
+    tokens = [token for token, _ in sorted(vocab.items(), key=lambda item: item[1])][: config["vocab_size"]]
+    if tokens[-1] == "<pad>":
+        tokens.pop()
+    spec.register_source_vocabulary(tokens)
+    spec.register_target_vocabulary(tokens)
+    return spec
+
+
+def _safetensors_marian_converter():
+    """Return a ctranslate2 Converter class for --no-torch Marian conversions."""
+    from ctranslate2.converters import Converter
+
+    class SafetensorsMarianConverter(Converter):
+        def __init__(self, model_dir: str):
+            self._model_dir = Path(model_dir)
+
+        def _load(self):
+            return _marian_spec_from_safetensors(self._model_dir)
+
+    return SafetensorsMarianConverter
+
+
+def _single_load_converter(model_dir: Path, conversions: int, converter_class=None, **init_kwargs: object):
+    """Build a converter that loads the checkpoint once for ``conversions`` convert() calls.
+
+    ``converter_class`` defaults to TransformersConverter. ``Converter.convert`` calls ``_load``
+    and then quantizes the returned spec in place, so every conversion but the last gets a
+    deep copy of the unquantized spec; the last one (or the only one) gets the spec itself
+    and the cached reference is dropped.
+    """
+    if converter_class is None:
+        from ctranslate2.converters import TransformersConverter as converter_class
+
+    class SingleLoadConverter(converter_class):
+        _spec = None
+        _loads_left = conversions
+
+        def _load(self):
+            self._loads_left -= 1
+            spec = self._spec if self._spec is not None else super()._load()
+            if self._loads_left > 0:
+                self._spec = spec
+                return copy.deepcopy(spec)
+            self._spec = None
+            return spec
+
+    return SingleLoadConverter(str(model_dir), **init_kwargs)
+
+
 def convert_model(
+    model_dir: Path,
+    targets: list[tuple[str, Path]],
+    force: bool,
+    extra_args: list[str],
+    copy_globs: list[str] | None = None,
+    use_cli: bool = False,
+    verbose: bool = False,
+    no_torch: bool = False,
+) -> None:
+    """Convert ``model_dir`` once per ``(quantization, output_dir)`` in ``targets``.
+
+    With ``no_torch``, checkpoints the numpy converter cannot handle go through
+    ct2-transformers-converter, since torch cannot be imported in this process.
+    """
+    copy_files = aux_files(model_dir, copy_globs or [])
+    if no_torch and not use_cli:
+        init_kwargs, convert_kwargs = converter_kwargs(extra_args)
+        if init_kwargs:
+            reason = ", ".join(f"--{name}" for name in init_kwargs) + " needs TransformersConverter"
+        else:
+            config = json.loads((model_dir / "config.json").read_text())
+            filenames = [path.name for path in model_dir.iterdir()]
+            reason = no_torch_unsupported(config, filenames, [quantization for quantization, _ in targets])
+        if reason is None:
+            _rich_print("[cyan]Converting model in-process from safetensors without torch...[/cyan]")
+            converter = _single_load_converter(model_dir, len(targets), _safetensors_marian_converter())
+            for quantization, output_dir in targets:
+                converter.convert(str(output_dir), quantization=quantization, force=force, **convert_kwargs)
+                copy_aux_files(model_dir, copy_files, output_dir)
+            return
+        _rich_print(f"[yellow]--no-torch: {reason}; converting with ct2-transformers-converter instead.[/yellow]")
+        use_cli = True
+    if not use_cli:
+        init_kwargs, convert_kwargs = converter_kwargs(extra_args)
+        _rich_print("[cyan]Converting model in-process with TransformersConverter...[/cyan]")
+        converter = _single_load_converter(model_dir, len(targets), **init_kwargs)
+        for quantization, output_dir in targets:
+            converter.convert(str(output_dir), quantization=quantization, force=force, **convert_kwargs)
+            copy_aux_files(model_dir, copy_files, output_dir)
+        return
+
+    ensure_converter_cli()
+    for quantization, output_dir in targets:
+        run_converter_cli(_converter_cli_command(model_dir, output_dir, quantization, force, extra_args, verbose))
+        copy_aux_files(model_dir, copy_files, output_dir)
+
+
+def _converter_cli_command(
     model_dir: Path,
     output_dir: Path,
     quantization: str,
     force: bool,
     extra_args: list[str],
-) -> None:
+    verbose: bool,
+) -> list[str]:
     cmd = [
         "ct2-transformers-converter",
         "--model",
@@ -89,45 +927,296 @@ def convert_model(
         str(output_dir),
         "--quantization",
         quantization,
-        "--copy_files",
-        "tokenizer.json",
-        "--copy_files",
-        "tokenizer_config.json",
     ]
     if force:
         cmd.append("--force")
     if extra_args:
         cmd.extend(extra_args)
 
-    print(f"[cyan]Converting model with command:[/] {' '.join(cmd)}")
-    subprocess.run(cmd, check=True)
+    if verbose:
+        _rich_print("[cyan]Converting model with command:[/cyan]")
+        # Plain print: the shell-quoted command must not go through rich's markup parser.
+        print(shlex.join(cmd), file=sys.stderr, flush=True)
+    else:
+        _rich_print(f"[cyan]Converting model with ct2-transformers-converter ({quantization})...[/cyan]")
+    return cmd
 
 
-def main() -> None:
-    args = parse_args()
-    ensure_converter_cli()
+def link_into_local_dir(snapshot: Path, local_dir: Path) -> Path:
+    """Hard-link every file of the cached ``snapshot`` into ``local_dir``; returns ``local_dir``.
+
+    Files are copied when linking fails (typically because the cache and ``local_dir`` are on
+    different filesystems), with a warning since that doubles disk usage.
+    """
+    copied = []
+    for src in snapshot.rglob("*"):
+        if src.is_dir():
+            continue
+        dst = local_dir / src.relative_to(snapshot)
+        dst.parent.mkdir(parents=True, exist_ok=True)
+        dst.unlink(missing_ok=True)
+        # Snapshot entries are symlinks into blobs/; link the blob itself.
+        blob = src.resolve()
+        try:
+            os.link(blob, dst)
+        except OSError:
+            shutil.copyfile(blob, dst)
+            copied.append(dst.name)
+    if copied:
+        _rich_print(
+            f"[yellow]Could not hard-link {', '.join(copied)} from the Hugging Face cache into {local_dir} "
+            "(different filesystems?); copied instead, doubling disk usage.[/yellow]"
+        )
+    return local_dir
+
+
+def _sha256(path: Path) -> str:
+    with path.open("rb") as handle:
+        return hashlib.file_digest(handle, "sha256").hexdigest()
+
+
+def verify_download(repo_id: str, revision: str, download_path: Path) -> list[str]:
+    """Hash every LFS file in ``download_path`` in parallel; return names that do not match."""
+    from huggingface_hub import HfApi
+
+    info = HfApi().model_info(repo_id, revision=revision, files_metadata=True)
+    expected = {
+        sibling.rfilename: sibling.lfs.sha256
+        for sibling in info.siblings or []
+        if sibling.lfs is not None and (download_path / sibling.rfilename).exists()
+    }
+    if not expected:
+        return []
+    _rich_print(f"[cyan]Verifying {len(expected)} weight file(s)...[/cyan]")
+    names = list(expected)
+    with ThreadPoolExecutor(max_workers=min(len(names), os.cpu_count() or 1)) as pool:
+        digests = pool.map(_sha256, (download_path / name for name in names))
+        return [name for name, digest in zip(names, digests) if digest != expected[name]]
+
+
+def _raise_system_exit(signum, frame):
+    raise SystemExit(128 + signum)
+
+
+@contextmanager
+def staging_dir(output_dir: Path) -> Iterator[Path]:
+    """Yield a sibling temp dir that atomically replaces ``output_dir`` on success.
+
+    The sibling is on the same filesystem, so the final ``os.replace`` is a rename rather
+    than a copy, and an interrupted conversion never leaves a half-written ``output_dir``.
+    The temp dir is removed on failure, including SIGTERM.
+    """
+    tmp_out = output_dir.with_name(f"{output_dir.name}.tmp.{os.getpid()}")
+    previous_handler = signal.signal(signal.SIGTERM, _raise_system_exit)
+    try:
+        yield tmp_out
+        if output_dir.exists() or output_dir.is_symlink():
+            old = output_dir.with_name(f"{output_dir.name}.old.{os.getpid()}")
+            os.replace(output_dir, old)
+            os.replace(tmp_out, output_dir)
+            if old.is_dir() and not old.is_symlink():
+                shutil.rmtree(old, ignore_errors=True)
+            else:
+                old.unlink(missing_ok=True)
+        else:
+            os.replace(tmp_out, output_dir)
+    finally:
+        signal.signal(signal.SIGTERM, previous_handler)
+        shutil.rmtree(tmp_out, ignore_errors=True)
 
-    output_dir = Path(args.output_dir).expanduser().resolve()
-    if output_dir.exists() and not args.force:
-        print(f"[red]Output directory {output_dir} already exists. Use --force to overwrite.[/red]")
-        sys.exit(1)
-    output_dir.mkdir(parents=True, exist_ok=True)
 
-    print(f"[green]Downloading Hugging Face model {args.translation_model} (revision {args.revision})...[/green]")
-    download_path = snapshot_download(
+def _in_daemon_thread(func, *args: object, **kwargs: object) -> Future:
+    """Run ``func`` on a daemon thread, returning a future for its result."""
+    future: Future = Future()
+    future.set_running_or_notify_cancel()
+
+    def _run() -> None:
+        try:
+            future.set_result(func(*args, **kwargs))
+        except BaseException as exc:
+            future.set_exception(exc)
+
+    threading.Thread(target=_run, name=getattr(func, "__name__", "worker"), daemon=True).start()
+    return future
+
+
+def download_and_prepare(args: argparse.Namespace, revision_sha: str) -> str:
+    """Download the snapshot at ``revision_sha`` while preparing the converter; returns its path."""
+    from huggingface_hub import snapshot_download
+
+    _rich_print(
+        f"[green]Downloading Hugging Face model {args.translation_model} "
+        f"(revision {args.revision} at {revision_sha})...[/green]"
+    )
+    download = _in_daemon_thread(
+        snapshot_download,
         repo_id=args.translation_model,
-        revision=args.revision,
+        # The commit the version dir is named after, not the branch, which may have moved since.
+        revision=revision_sha,
         cache_dir=args.cache_dir,
-        local_dir=None,
-        local_dir_use_symlinks=True,
+        max_workers=max(1, args.max_workers),
     )
+    prepare = _in_daemon_thread(prepare_converter, args.use_cli)
+    # Surface the first failure from either stage without waiting on the other. Daemon
+    # threads (unlike a ThreadPoolExecutor's, which are joined at exit) let the script
+    # exit straight away instead of finishing a download nobody will use.
+    done, _ = wait([download, prepare], return_when=FIRST_EXCEPTION)
+    for future in done:
+        future.result()
+    prepare.result()
+    return download.result()
+
 
-    download_path = Path(download_path).resolve()
-    print(f"[green]Download complete: {download_path}[/green]")
+def convert(args: argparse.Namespace) -> dict[str, object] | None:
+    """Download and convert ``args.translation_model`` into ``args.output_dir``.
+
+    With --dry-run nothing is downloaded or converted and the plan is returned instead.
+    """
+    # Not resolved: output_dir is itself a symlink to the current converted revision, and
+    # abspath avoids realpath()'s per-component symlink walk on slow (NFS/FUSE) mounts.
+    output_dir = Path(os.path.abspath(os.path.expanduser(args.output_dir)))
+    quantizations = list(dict.fromkeys(resolve_quantization(q) for q in args.quantization or ["int8_float16"]))
+    if args.dry_run:
+        return plan_conversion(args, output_dir, quantizations)
+    cached = cached_snapshot(args.translation_model, args.revision, args.cache_dir)
+    revision_sha = resolve_revision_sha(args.translation_model, args.revision, cached)
+    version_dirs = {
+        quantization: versions_root(output_dir) / f"{model_slug(args.translation_model)}@{revision_sha}-{quantization}"
+        for quantization in quantizations
+    }
+    pending = [
+        quantization
+        for quantization, version_dir in version_dirs.items()
+        if args.force or not is_up_to_date(version_dir, revision_sha, quantization)
+    ]
+    links = output_links(output_dir, version_dirs)
+    check_output_links(links, args.force)
+    if not pending:
+        point_outputs_at(links)
+        _rich_print(
+            f"[bold green]{output_dir} is already converted ({', '.join(quantizations)}); nothing to do.[/bold green]"
+        )
+        return None
+    os.makedirs(versions_root(output_dir), exist_ok=True)
+
+    if cached is not None:
+        _rich_print(f"[green]Using cached snapshot {cached} (revision {args.revision}); skipping download.[/green]")
+        download_path = cached
+        prepare_converter(args.use_cli)
+    else:
+        download_path = download_and_prepare(args, revision_sha)
+        download_path = Path(download_path).resolve()
+        _rich_print(f"[green]Download complete: {download_path}[/green]")
+        if args.verify:
+            mismatched = verify_download(args.translation_model, revision_sha, download_path)
+            if mismatched:
+                _rich_print(
+                    f"[red]Checksum mismatch for {', '.join(mismatched)}; the download is corrupt. "
+                    "Delete the affected files and re-run.[/red]"
+                )
+                sys.exit(1)
+        record_revision_ref(args.translation_model, args.revision, revision_sha, args.cache_dir)
+    if args.local_dir:
+        download_path = link_into_local_dir(download_path, Path(args.local_dir).expanduser().resolve())
+
+    if args.preflight:
+        preflight_check(download_path, versions_root(output_dir), len(pending), args.use_cli)
+    _rich_print(
+        f"[green]Converting to CTranslate2 format in {versions_root(output_dir)} "
+        f"(quantization={', '.join(pending)})...[/green]"
+    )
+    # Every variant is staged first and only swapped in once all of them converted.
+    with ExitStack() as stack:
+        targets = [
+            (quantization, stack.enter_context(staging_dir(version_dirs[quantization]))) for quantization in pending
+        ]
+        convert_model(
+            download_path,
+            targets,
+            True,
+            args.converter_arg,
+            copy_globs=args.copy_glob,
+            use_cli=args.use_cli,
+            verbose=args.verbose,
+            no_torch=args.no_torch,
+        )
+        for quantization, tmp_out in targets:
+            write_conversion_meta(tmp_out, args.translation_model, revision_sha, quantization)
+    point_outputs_at(links)
+    if not args.keep_hf_cache and args.local_dir is None:
+        prune_hf_cache(args.translation_model, args.cache_dir)
+    _rich_print(f"[bold green]Done! {output_dir} -> {version_dirs[quantizations[0]].name}[/bold green]")
+    return None
 
-    print(f"[green]Converting to CTranslate2 format in {output_dir} (quantization={args.quantization})...[/green]")
-    convert_model(download_path, output_dir, args.quantization, args.force, args.converter_arg)
-    print("[bold green]Done![/bold green]")
+
+def _init_worker(no_torch: bool) -> None:
+    # Each conversion already keeps a core busy; cap the BLAS/OpenMP pool torch starts per child.
+    os.environ["OMP_NUM_THREADS"] = "2"
+    if no_torch:
+        disable_torch_import()
+
+
+def _convert_one(
+    args: argparse.Namespace, model_id: str, output_dir: Path
+) -> tuple[str, str | None, dict[str, object] | None]:
+    """Pool worker: convert ``model_id`` into ``output_dir``.
+
+    Returns (model_id, error or None, --dry-run plan or None); plans are printed by the
+    parent so workers never interleave on stdout.
+
+    SystemExit is turned into an error string as well: left alone it would kill the worker
+    and leave the pool waiting on a result that never arrives.
+    """
+    overrides = {"translation_model": model_id, "output_dir": str(output_dir)}
+    if args.local_dir is not None:
+        overrides["local_dir"] = str(Path(args.local_dir) / model_slug(model_id))
+    try:
+        plan = convert(argparse.Namespace(**{**vars(args), **overrides}))
+    except SystemExit as exc:
+        if exc.code not in (None, 0):
+            return model_id, exc.code if isinstance(exc.code, str) else f"exited with status {exc.code}", None
+        plan = None
+    except Exception as exc:
+        return model_id, f"{type(exc).__name__}: {exc}", None
+    return model_id, None, plan
+
+
+def convert_batch(args: argparse.Namespace) -> None:
+    """Convert every model listed in ``args.models_file`` with a pool of ``args.jobs`` processes."""
+    lines = Path(args.models_file).read_text().splitlines()
+    model_ids = list(dict.fromkeys(filter(None, (line.split("#", 1)[0].strip() for line in lines))))
+    if not model_ids:
+        raise SystemExit(f"[red]No model IDs found in {args.models_file}.[/red]")
+    output_root = Path(os.path.abspath(os.path.expanduser(args.output_dir)))
+    jobs = max(1, min(args.jobs, len(model_ids)))
+    _rich_print(f"[green]Converting {len(model_ids)} model(s) from {args.models_file} with {jobs} job(s)...[/green]")
+    with multiprocessing.Pool(jobs, initializer=_init_worker, initargs=(args.no_torch,)) as pool:
+        results = pool.starmap(
+            _convert_one, [(args, model_id, output_root / model_slug(model_id)) for model_id in model_ids]
+        )
+    failed = [(model_id, error) for model_id, error, _ in results if error is not None]
+    for model_id, error in failed:
+        _rich_print(f"[red]{model_id}: {error}[/red]")
+    if args.dry_run:
+        print_json(data=[plan for _, _, plan in results if plan is not None])
+    if failed:
+        sys.exit(1)
+    if args.dry_run:
+        return
+    _rich_print(f"[bold green]Converted {len(model_ids)} model(s) into {output_root}.[/bold green]")
+
+
+def main() -> None:
+    args = parse_args()
+    configure_download_backend(args.parallel)
+    if args.no_torch and not args.use_cli:
+        disable_torch_import()
+    if args.models_file:
+        convert_batch(args)
+    else:
+        plan = convert(args)
+        if plan is not None:
+            print_json(data=plan)
 
 
 if __name__ == "__main__":